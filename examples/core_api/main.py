@@ -1,24 +1,32 @@
 """Core-only API example using BaseServiceBuilder with custom User entity."""
 
+from typing import Any
+
 from fastapi import Depends, FastAPI
+from sqlalchemy import Index, String, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 from ulid import ULID
 
 from servicekit import BaseManager, BaseRepository, Entity, EntityIn, EntityOut
 from servicekit.api import BaseServiceBuilder, CrudRouter, ServiceInfo
-from servicekit.api.dependencies import get_session
+from servicekit.api.dependencies import get_database, get_session
 
 
 class User(Entity):
     """User entity for authentication and profile management."""
 
     __tablename__ = "users"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        Index("ix_users_active_username", "is_active", "username"),
+        {"extend_existing": True},
+    )
 
-    username: Mapped[str] = mapped_column(unique=True, index=True)
-    email: Mapped[str] = mapped_column(unique=True, index=True)
-    full_name: Mapped[str | None] = mapped_column(default=None)
+    username: Mapped[str] = mapped_column(String(64), unique=True, index=True)
+    email: Mapped[str] = mapped_column(String(254), unique=True, index=True)
+    full_name: Mapped[str | None] = mapped_column(String(120), default=None)
     is_active: Mapped[bool] = mapped_column(default=True)
 
 
@@ -49,8 +57,6 @@ class UserRepository(BaseRepository[User, ULID]):
 
     async def find_by_username(self, username: str) -> User | None:
         """Find a user by username."""
-        from sqlalchemy import select
-
         stmt = select(self.model).where(self.model.username == username)
         result = await self.s.execute(stmt)
         return result.scalar_one_or_none()
@@ -75,78 +81,64 @@ def get_user_manager(session: AsyncSession = Depends(get_session)) -> UserManage
     return UserManager(UserRepository(session))
 
 
+# Example users with stable ULIDs for Postman testing
+SEED_USERS: list[dict[str, Any]] = [
+    {
+        "id": ULID.from_str("01JARKBV9QFY8P7X3Z2E4M6N5Q"),
+        "username": "alice",
+        "email": "alice@example.com",
+        "full_name": "Alice Smith",
+        "is_active": True,
+        "tags": ["admin", "team-alpha", "premium"],
+    },
+    {
+        "id": ULID.from_str("01JARKBV9R8Y7W6V5T4S3R2P1N"),
+        "username": "bob",
+        "email": "bob@example.com",
+        "full_name": "Bob Johnson",
+        "is_active": True,
+        "tags": ["developer", "team-beta"],
+    },
+    {
+        "id": ULID.from_str("01JARKBV9S0000000000000000"),
+        "username": "charlie",
+        "email": "charlie@example.com",
+        "full_name": "Charlie Davis",
+        "is_active": True,
+        "tags": ["designer", "team-alpha", "contractor"],
+    },
+    {
+        "id": ULID.from_str("01JARKBV9T0000000000000000"),
+        "username": "diana",
+        "email": "diana@example.com",
+        "full_name": "Diana Martinez",
+        "is_active": False,
+        "tags": ["developer", "team-beta", "on-leave"],
+    },
+    {
+        "id": ULID.from_str("01JARKBV9V0000000000000000"),
+        "username": "eve",
+        "email": "eve@example.com",
+        "full_name": "Eve Thompson",
+        "is_active": True,
+        "tags": ["qa-engineer", "team-gamma"],
+    },
+]
+
+
+# Dialect-specific INSERT constructs supporting ON CONFLICT DO NOTHING
+INSERT_BY_DIALECT = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
 async def seed_users(app: FastAPI) -> None:
     """Seed example users on startup with stable ULIDs for testing."""
-    from servicekit.api.dependencies import get_database
-
     db = get_database()
     async with db.session() as session:
-        repository = UserRepository(session)
-        manager = UserManager(repository)
-
-        # Check if users already exist
-        existing = await manager.find_by_username("alice")
-        if existing:
-            return
-
-        # Create example users with stable ULIDs for Postman testing
-        # Alice: 01JARKBV9QFY8P7X3Z2E4M6N5Q
-        alice = User(
-            id=ULID.from_str("01JARKBV9QFY8P7X3Z2E4M6N5Q"),
-            username="alice",
-            email="alice@example.com",
-            full_name="Alice Smith",
-            is_active=True,
-            tags=["admin", "team-alpha", "premium"],
-        )
-        await repository.save(alice)
-
-        # Bob: 01JARKBV9R8Y7W6V5T4S3R2P1N
-        bob = User(
-            id=ULID.from_str("01JARKBV9R8Y7W6V5T4S3R2P1N"),
-            username="bob",
-            email="bob@example.com",
-            full_name="Bob Johnson",
-            is_active=True,
-            tags=["developer", "team-beta"],
-        )
-        await repository.save(bob)
-
-        # Charlie: 01JARKBV9S0000000000000000
-        charlie = User(
-            id=ULID.from_str("01JARKBV9S0000000000000000"),
-            username="charlie",
-            email="charlie@example.com",
-            full_name="Charlie Davis",
-            is_active=True,
-            tags=["designer", "team-alpha", "contractor"],
-        )
-        await repository.save(charlie)
-
-        # Diana: 01JARKBV9T0000000000000000
-        diana = User(
-            id=ULID.from_str("01JARKBV9T0000000000000000"),
-            username="diana",
-            email="diana@example.com",
-            full_name="Diana Martinez",
-            is_active=False,
-            tags=["developer", "team-beta", "on-leave"],
-        )
-        await repository.save(diana)
-
-        # Eve: 01JARKBV9V0000000000000000
-        eve = User(
-            id=ULID.from_str("01JARKBV9V0000000000000000"),
-            username="eve",
-            email="eve@example.com",
-            full_name="Eve Thompson",
-            is_active=True,
-            tags=["qa-engineer", "team-gamma"],
-        )
-        await repository.save(eve)
-
-        # Commit all users
-        await repository.commit()
+        # Single idempotent statement: rows that already exist (id, username or email) are skipped,
+        # so restarts and concurrently starting workers need no SELECT-then-INSERT round trip
+        dialect_insert = INSERT_BY_DIALECT[session.get_bind().dialect.name]
+        await session.execute(dialect_insert(User).on_conflict_do_nothing(), SEED_USERS)
+        await session.commit()
 
 
 user_router = CrudRouter.create(
@@ -2,6 +2,7 @@
 
 import asyncio
 
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Mapped, mapped_column
 from ulid import ULID
@@ -50,20 +51,26 @@ class ProductRepository(BaseRepository[Product, ULID]):
 
     async def find_by_sku(self, sku: str) -> Product | None:
         """Find a product by SKU."""
-        from sqlalchemy import select
-
         stmt = select(self.model).where(self.model.sku == sku)
         result = await self.s.execute(stmt)
         return result.scalar_one_or_none()
 
     async def find_low_stock(self, threshold: int = 10) -> list[Product]:
         """Find products with stock below threshold."""
-        from sqlalchemy import select
-
         stmt = select(self.model).where(self.model.stock < threshold).where(self.model.active.is_(True))
         result = await self.s.execute(stmt)
         return list(result.scalars().all())
 
+    async def increment_stock(self, product_id: ULID, quantity: int) -> Product | None:
+        """Atomically add quantity to a product's stock with UPDATE ... RETURNING."""
+        stmt = (
+            update(self.model)
+            .where(self.model.id == product_id)
+            .values(stock=self.model.stock + quantity)
+            .returning(self.model)
+        )
+        return await self.s.scalar(stmt)
+
 
 class ProductManager(BaseManager[Product, ProductIn, ProductOut, ULID]):
     """Manager for product business logic with validation."""
@@ -81,16 +88,15 @@ class ProductManager(BaseManager[Product, ProductIn, ProductOut, ULID]):
     async def find_low_stock(self, threshold: int = 10) -> list[ProductOut]:
         """Find products with low stock."""
         products = await self.repo.find_low_stock(threshold)
-        return [self._to_output_schema(p) for p in products]
+        return self._to_output_schemas(products)
 
     async def restock(self, product_id: ULID, quantity: int) -> ProductOut:
         """Add stock to a product."""
-        product = await self.repo.find_by_id(product_id)
+        product = await self.repo.increment_stock(product_id, quantity)
         if not product:
             raise ValueError(f"Product {product_id} not found")
 
-        product.stock += quantity
-        await self.repo.save(product)
+        await self.repo.commit()
         return self._to_output_schema(product)
 
 
@@ -105,37 +111,17 @@ async def main() -> None:
             repo = ProductRepository(session)
             manager = ProductManager(repo)
 
-            # Create sample products
+            # Create sample products (one flush and commit for the whole batch)
             print("Creating products...")
-            laptop = await manager.save(
-                ProductIn(
-                    sku="LAPTOP-001",
-                    name="Professional Laptop",
-                    price=1299.99,
-                    stock=15,
-                )
-            )
-            print(f"✓ Created: {laptop.name} (SKU: {laptop.sku}, Stock: {laptop.stock})")
-
-            mouse = await manager.save(
-                ProductIn(
-                    sku="MOUSE-001",
-                    name="Wireless Mouse",
-                    price=29.99,
-                    stock=5,
-                )
-            )
-            print(f"✓ Created: {mouse.name} (SKU: {mouse.sku}, Stock: {mouse.stock})")
-
-            keyboard = await manager.save(
-                ProductIn(
-                    sku="KEYBOARD-001",
-                    name="Mechanical Keyboard",
-                    price=149.99,
-                    stock=8,
-                )
+            laptop, mouse, keyboard = await manager.save_all(
+                [
+                    ProductIn(sku="LAPTOP-001", name="Professional Laptop", price=1299.99, stock=15),
+                    ProductIn(sku="MOUSE-001", name="Wireless Mouse", price=29.99, stock=5),
+                    ProductIn(sku="KEYBOARD-001", name="Mechanical Keyboard", price=149.99, stock=8),
+                ]
             )
-            print(f"✓ Created: {keyboard.name} (SKU: {keyboard.sku}, Stock: {keyboard.stock})")
+            for product in (laptop, mouse, keyboard):
+                print(f"✓ Created: {product.name} (SKU: {product.sku}, Stock: {product.stock})")
 
             # Find by SKU
             print("\nFinding product by SKU...")
@@ -11,11 +11,14 @@ from pydantic import BaseModel, Field
 from servicekit.api import BaseServiceBuilder, Router, ServiceInfo, build_location_url
 from servicekit.api.dependencies import get_scheduler
 from servicekit.exceptions import NotFoundError
+from servicekit.logging import get_logger
 from servicekit.scheduler import Scheduler
 from servicekit.schemas import JobRecord
 
 ULID = ulid.ULID
 
+logger = get_logger(__name__)
+
 
 class ComputeRequest(BaseModel):
     """Request schema for starting a computation with duration."""
@@ -46,9 +49,9 @@ class ComputeResultResponse(BaseModel):
 
 async def long_running_computation(duration: float) -> int:
     """Simulate a long-running computation task that sleeps for given duration."""
-    print(f"[TASK] Starting computation for {duration}s...")
+    logger.info("computation.started", duration=duration)
     await asyncio.sleep(duration)
-    print("[TASK] Computation complete, returning 42")
+    logger.info("computation.completed", result=42)
     return 42
 
 
@@ -93,10 +96,10 @@ class ComputeRouter(Router):
             scheduler: Annotated[Scheduler, Depends(get_scheduler)],
         ) -> ComputeResultResponse:
             """Get the result or status of a computation job."""
-            ulid_id = ULID.from_str(job_id)
             try:
+                ulid_id = ULID.from_str(job_id)
                 record: JobRecord = await scheduler.get_record(ulid_id)
-            except KeyError:
+            except (ValueError, KeyError):
                 raise NotFoundError(f"Job {job_id} not found")
 
             result_value = None
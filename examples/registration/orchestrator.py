@@ -97,17 +97,18 @@ class RegistrationRouter(Router):
 
             # Calculate expiration time
             now = datetime.now(UTC)
-            expires_at = now + timedelta(seconds=TTL_SECONDS)
+            now_iso = now.isoformat()
+            expires_iso = (now + timedelta(seconds=TTL_SECONDS)).isoformat()
 
             # Store in Valkey with automatic TTL
             service_data = {
                 "id": service_id,
                 "url": service_url,
                 "info": service_info,
-                "registered_at": now.isoformat(),
-                "last_updated": now.isoformat(),
-                "last_ping_at": now.isoformat(),
-                "expires_at": expires_at.isoformat(),
+                "registered_at": now_iso,
+                "last_updated": now_iso,
+                "last_ping_at": now_iso,
+                "expires_at": expires_iso,
             }
 
             await redis_client.set(  # type: ignore
@@ -122,9 +123,9 @@ class RegistrationRouter(Router):
                 "service_url": service_url,
                 "display_name": service_info.get("display_name", "Unknown"),
                 "version": service_info.get("version", "Unknown"),
-                "registered_at": now.isoformat(),
+                "registered_at": now_iso,
                 "ttl_seconds": TTL_SECONDS,
-                "expires_at": expires_at.isoformat(),
+                "expires_at": expires_iso,
             }
             if "deployment_env" in service_info:
                 log_context["deployment_env"] = service_info["deployment_env"]
@@ -162,11 +163,12 @@ class RegistrationRouter(Router):
 
             # Update last ping time and expiration
             now = datetime.now(UTC)
-            expires_at = now + timedelta(seconds=TTL_SECONDS)
+            now_iso = now.isoformat()
+            expires_iso = (now + timedelta(seconds=TTL_SECONDS)).isoformat()
 
-            service_data["last_ping_at"] = now.isoformat()
-            service_data["expires_at"] = expires_at.isoformat()
-            service_data["last_updated"] = now.isoformat()
+            service_data["last_ping_at"] = now_iso
+            service_data["expires_at"] = expires_iso
+            service_data["last_updated"] = now_iso
 
             # Update in Valkey and reset TTL
             await redis_client.set(  # type: ignore
@@ -180,15 +182,15 @@ class RegistrationRouter(Router):
                 service_id=service_id,
                 service_url=service_data["url"],
                 display_name=service_data["info"].get("display_name", "Unknown"),
-                last_ping_at=now.isoformat(),
-                expires_at=expires_at.isoformat(),
+                last_ping_at=now_iso,
+                expires_at=expires_iso,
             )
 
             return PingResponse(
                 id=service_id,
                 status="alive",
-                last_ping_at=now.isoformat(),
-                expires_at=expires_at.isoformat(),
+                last_ping_at=now_iso,
+                expires_at=expires_iso,
             )
 
         @self.router.get("", response_model=ServiceListResponse)
@@ -197,12 +199,10 @@ class RegistrationRouter(Router):
             # Get all service keys
             keys = await redis_client.keys("service:*")  # type: ignore
 
-            services = []
-            for key in keys:
-                service_data_raw = await redis_client.get(key)  # type: ignore
-                if service_data_raw:
-                    service_data = json.loads(service_data_raw)
-                    services.append(ServiceDetail(**service_data))
+            # Fetch every record in one MGET round trip instead of one GET per key; entries that expired
+            # between KEYS and MGET come back as None. Pydantic parses the stored JSON directly.
+            values = await redis_client.mget(keys) if keys else []  # type: ignore
+            services = [ServiceDetail.model_validate_json(raw) for raw in values if raw]
 
             return ServiceListResponse(
                 count=len(services),
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import Any, Set
+from typing import AbstractSet, Any, Set
 
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
@@ -23,9 +23,9 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         self,
         app: Any,
         *,
-        api_keys: Set[str],
+        api_keys: AbstractSet[str],
         header_name: str = "X-API-Key",
-        unauthenticated_paths: Set[str],
+        unauthenticated_paths: AbstractSet[str],
     ) -> None:
         """Initialize API key middleware.
 
@@ -36,9 +36,10 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
             unauthenticated_paths: Paths that don't require authentication
         """
         super().__init__(app)
-        self.api_keys = api_keys
+        # Freeze once so per-request membership checks are O(1) hash lookups on an immutable set
+        self.api_keys = frozenset(api_keys)
         self.header_name = header_name
-        self.unauthenticated_paths = unauthenticated_paths
+        self.unauthenticated_paths = frozenset(unauthenticated_paths)
 
     async def dispatch(self, request: Request, call_next: MiddlewareCallNext) -> Response:
         """Process request with API key authentication."""
@@ -134,14 +135,9 @@ def load_api_keys_from_file(file_path: str | Path) -> Set[str]:
     if not path.exists():
         raise FileNotFoundError(f"API key file not found: {file_path}")
 
-    keys = set()
-    with path.open("r") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#"):  # Skip empty lines and comments
-                keys.add(line)
-
-    return keys
+    # Single read + C-level line split; skip empty lines and comments
+    lines = (line.strip() for line in path.read_text().splitlines())
+    return {line for line in lines if line and not line.startswith("#")}
 
 
 def validate_api_key_format(key: str) -> bool:
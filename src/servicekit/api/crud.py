@@ -284,10 +284,11 @@ class CrudRouter[InSchemaT: BaseModel, OutSchemaT: BaseModel](Router):
 
     def _register_schema_route(self) -> None:
         """Register JSON schema endpoint for the entity output type."""
-        entity_out_type = self.entity_out_type
+        # Generated once at router creation and served from memory
+        entity_out_schema = self.entity_out_type.model_json_schema()
 
         async def get_schema() -> dict[str, Any]:
-            return entity_out_type.model_json_schema()
+            return entity_out_schema
 
         self.register_collection_operation(
             name="schema",
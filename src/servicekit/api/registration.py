@@ -3,6 +3,7 @@
 import asyncio
 import os
 import socket
+from contextlib import AsyncExitStack
 from typing import Any
 
 import httpx
@@ -33,6 +34,8 @@ class RegistrationConfig(BaseModel):
     port_env: str = "SERVICEKIT_PORT"
     max_retries: int = 5
     retry_delay: float = 2.0
+    retry_backoff: float = 1.0
+    max_retry_delay: float = 30.0
     fail_on_error: bool = False
     timeout: float = 10.0
     service_key: str | None = None
@@ -57,6 +60,8 @@ async def register_service(
     port_env: str = "SERVICEKIT_PORT",
     max_retries: int = 5,
     retry_delay: float = 2.0,
+    retry_backoff: float = 1.0,
+    max_retry_delay: float = 30.0,
     fail_on_error: bool = False,
     timeout: float = 10.0,
     service_key: str | None = None,
@@ -160,15 +165,21 @@ async def register_service(
 
     # Registration with retry logic
     last_error: Exception | None = None
+    delay = retry_delay
 
     # Build headers with optional service key
     headers: dict[str, str] = {}
     if resolved_service_key:
         headers["X-Service-Key"] = resolved_service_key
 
-    for attempt in range(1, max_retries + 1):
-        try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
+    # One client for all attempts so retries reuse the connection pool instead of reconnecting.
+    # It is opened inside the attempt's try so construction errors follow the retry/fail_on_error policy.
+    async with AsyncExitStack() as stack:
+        client: httpx.AsyncClient | None = None
+        for attempt in range(1, max_retries + 1):
+            try:
+                if client is None:
+                    client = await stack.enter_async_context(httpx.AsyncClient(timeout=timeout))
                 response = await client.post(
                     resolved_orchestrator_url,
                     json=payload,
@@ -203,25 +214,28 @@ async def register_service(
                     "ping_url": _ping_url,
                 }
 
-        except Exception as e:
-            last_error = e
-            logger.warning(
-                "registration.attempt_failed",
-                orchestrator_url=resolved_orchestrator_url,
-                service_url=service_url,
-                attempt=attempt,
-                max_retries=max_retries,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-
-            if attempt < max_retries:
-                logger.debug(
-                    "registration.retrying",
-                    retry_delay=retry_delay,
-                    next_attempt=attempt + 1,
+            except Exception as e:
+                last_error = e
+                logger.warning(
+                    "registration.attempt_failed",
+                    orchestrator_url=resolved_orchestrator_url,
+                    service_url=service_url,
+                    attempt=attempt,
+                    max_retries=max_retries,
+                    error=str(e),
+                    error_type=type(e).__name__,
                 )
-                await asyncio.sleep(retry_delay)
+
+                if attempt < max_retries:
+                    logger.debug(
+                        "registration.retrying",
+                        retry_delay=delay,
+                        next_attempt=attempt + 1,
+                    )
+                    await asyncio.sleep(delay)
+                    # Capped exponential backoff, grown per step so long retry budgets cannot overflow.
+                    # The cap only limits growth; it never shortens the configured retry_delay.
+                    delay = max(retry_delay, min(delay * retry_backoff, max_retry_delay))
 
     # All retries exhausted
     logger.error(
@@ -254,11 +268,16 @@ async def _keepalive_loop(
     if service_key:
         headers["X-Service-Key"] = service_key
 
-    while True:
-        try:
-            await asyncio.sleep(interval)
+    # One client for the task's lifetime so pings reuse the keep-alive connection to the orchestrator.
+    # It is opened inside the loop's try so a construction error is logged as a failed ping, not fatal.
+    async with AsyncExitStack() as stack:
+        client: httpx.AsyncClient | None = None
+        while True:
+            try:
+                await asyncio.sleep(interval)
 
-            async with httpx.AsyncClient(timeout=timeout) as client:
+                if client is None:
+                    client = await stack.enter_async_context(httpx.AsyncClient(timeout=timeout))
                 response = await client.put(ping_url, headers=headers if headers else None)
                 response.raise_for_status()
 
@@ -270,50 +289,59 @@ async def _keepalive_loop(
                     expires_at=response_data.get("expires_at"),
                 )
 
-        except asyncio.CancelledError:
-            logger.info("keepalive.cancelled", service_id=_service_id)
-            raise
+            except asyncio.CancelledError:
+                logger.info("keepalive.cancelled", service_id=_service_id)
+                raise
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404 and registration_config is not None:
-                logger.warning(
-                    "keepalive.service_not_found",
-                    service_id=_service_id,
-                    ping_url=ping_url,
-                    grace_period=re_register_grace_period,
-                )
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404 and registration_config is not None:
+                    logger.warning(
+                        "keepalive.service_not_found",
+                        service_id=_service_id,
+                        ping_url=ping_url,
+                        grace_period=re_register_grace_period,
+                    )
 
-                # Grace period to avoid thundering herd during orchestrator flap
-                await asyncio.sleep(re_register_grace_period)
-
-                # Attempt re-registration with original parameters
-                try:
-                    result = await register_service(**registration_config.model_dump())
-                    if result and result.get("ping_url"):
-                        ping_url = result["ping_url"]
-                        # Rebuild headers in case service_key changed
-                        headers = {}
-                        if _service_key:
-                            headers["X-Service-Key"] = _service_key
-                        logger.info(
-                            "keepalive.re_registered",
-                            service_id=_service_id,
-                            new_ping_url=ping_url,
-                        )
-                    else:
+                    # Grace period to avoid thundering herd during orchestrator flap
+                    await asyncio.sleep(re_register_grace_period)
+
+                    # Attempt re-registration with original parameters
+                    try:
+                        result = await register_service(**registration_config.model_dump())
+                        if result and result.get("ping_url"):
+                            ping_url = result["ping_url"]
+                            # Rebuild headers in case service_key changed
+                            headers = {}
+                            if _service_key:
+                                headers["X-Service-Key"] = _service_key
+                            logger.info(
+                                "keepalive.re_registered",
+                                service_id=_service_id,
+                                new_ping_url=ping_url,
+                            )
+                        else:
+                            logger.warning(
+                                "keepalive.re_registration_failed",
+                                service_id=_service_id,
+                                reason="register_service returned None",
+                            )
+                    except Exception as re_reg_error:
                         logger.warning(
-                            "keepalive.re_registration_failed",
+                            "keepalive.re_registration_error",
                             service_id=_service_id,
-                            reason="register_service returned None",
+                            error=str(re_reg_error),
+                            error_type=type(re_reg_error).__name__,
                         )
-                except Exception as re_reg_error:
+                else:
                     logger.warning(
-                        "keepalive.re_registration_error",
+                        "keepalive.ping_failed",
                         service_id=_service_id,
-                        error=str(re_reg_error),
-                        error_type=type(re_reg_error).__name__,
+                        ping_url=ping_url,
+                        error=str(e),
+                        error_type=type(e).__name__,
                     )
-            else:
+
+            except Exception as e:
                 logger.warning(
                     "keepalive.ping_failed",
                     service_id=_service_id,
@@ -322,15 +350,6 @@ async def _keepalive_loop(
                     error_type=type(e).__name__,
                 )
 
-        except Exception as e:
-            logger.warning(
-                "keepalive.ping_failed",
-                service_id=_service_id,
-                ping_url=ping_url,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-
 
 async def start_keepalive(
     *,
@@ -47,10 +47,12 @@ class JobRouter(Router):
                 return [job for job in jobs if job.status == status_filter]
             return jobs
 
+        jobs_schema = TypeAdapter(list[JobRecord]).json_schema()
+
         @self.router.get("/$schema", summary="Get jobs list schema", response_model=dict[str, Any])
         async def get_jobs_schema() -> dict[str, Any]:
             """Get JSON schema for jobs list response."""
-            return TypeAdapter(list[JobRecord]).json_schema()
+            return jobs_schema
 
         @self.router.get("/{job_id}", summary="Get job by ID", response_model=JobRecord)
         async def get_job(
@@ -67,6 +67,8 @@ class SystemRouter(Router):
                 for app in app_manager.list()
             ]
 
+        apps_schema = TypeAdapter(list[AppInfo]).json_schema()
+
         @self.router.get(
             "/apps/$schema",
             summary="Get apps list schema",
@@ -74,4 +76,4 @@ class SystemRouter(Router):
         )
         async def get_apps_schema() -> dict[str, Any]:
             """Get JSON schema for apps list response."""
-            return TypeAdapter(list[AppInfo]).json_schema()
+            return apps_schema
@@ -62,9 +62,9 @@ class _JobOptions:
 class _AuthOptions:
     """Configuration for API key authentication."""
 
-    api_keys: set[str]
+    api_keys: frozenset[str]
     header_name: str
-    unauthenticated_paths: set[str]
+    unauthenticated_paths: frozenset[str]
     source: str
 
 
@@ -90,6 +90,8 @@ class _RegistrationOptions:
     port_env: str
     max_retries: int
     retry_delay: float
+    retry_backoff: float
+    max_retry_delay: float
     fail_on_error: bool
     timeout: float
     enable_keepalive: bool
@@ -144,6 +146,7 @@ class BaseServiceBuilder:
         self._max_overflow: int = 10
         self._pool_recycle: int = 3600
         self._pool_pre_ping: bool = True
+        self._prewarm_pool: bool = False
         self._include_error_handlers = include_error_handlers
         self._include_logging = include_logging
         self._health_options: _HealthOptions | None = None
@@ -168,8 +171,10 @@ class BaseServiceBuilder:
         max_overflow: int = 10,
         pool_recycle: int = 3600,
         pool_pre_ping: bool = True,
+        prewarm_pool: bool = False,
     ) -> Self:
         """Configure database with URL string, Database instance, or default in-memory SQLite."""
+        self._prewarm_pool = prewarm_pool
         if isinstance(url_or_instance, Database):
             # Pre-configured instance provided
             self._database_instance = url_or_instance
@@ -291,9 +296,9 @@ class BaseServiceBuilder:
         unauth_set = set(unauthenticated_paths) if unauthenticated_paths else default_unauth
 
         self._auth_options = _AuthOptions(
-            api_keys=keys,
+            api_keys=frozenset(keys),
             header_name=header_name,
-            unauthenticated_paths=unauth_set,
+            unauthenticated_paths=frozenset(unauth_set),
             source=auth_source,
         )
         return self
@@ -326,6 +331,8 @@ class BaseServiceBuilder:
         port_env: str = "SERVICEKIT_PORT",
         max_retries: int = 5,
         retry_delay: float = 2.0,
+        retry_backoff: float = 1.0,
+        max_retry_delay: float = 30.0,
         fail_on_error: bool = False,
         timeout: float = 10.0,
         enable_keepalive: bool = True,
@@ -345,6 +352,8 @@ class BaseServiceBuilder:
             port_env=port_env,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            retry_backoff=retry_backoff,
+            max_retry_delay=max_retry_delay,
             fail_on_error=fail_on_error,
             timeout=timeout,
             enable_keepalive=enable_keepalive,
@@ -522,6 +531,9 @@ class BaseServiceBuilder:
         for dependency, override in self._dependency_overrides.items():
             app.dependency_overrides[dependency] = override
 
+        # Generate the OpenAPI schema once up front so /openapi.json is served from the cached dict
+        app.openapi()
+
         return app
 
     # --------------------------------------------------------------------- Extension points
@@ -586,6 +598,7 @@ class BaseServiceBuilder:
         max_overflow = self._max_overflow
         pool_recycle = self._pool_recycle
         pool_pre_ping = self._pool_pre_ping
+        prewarm_pool = self._prewarm_pool
         job_options = self._job_options
         include_logging = self._include_logging
         registration_options = self._registration_options
@@ -627,6 +640,10 @@ class BaseServiceBuilder:
             # Always initialize database (safe to call multiple times)
             await database.init()
 
+            # Fill the connection pool up front so the first requests skip connect latency
+            if prewarm_pool:
+                await database.prewarm()
+
             set_database(database)
             app.state.database = database
 
@@ -740,9 +757,12 @@ class BaseServiceBuilder:
     @staticmethod
     def _create_openapi_customizer(app: FastAPI) -> Callable[[], dict[str, Any]]:
         """Create OpenAPI schema customizer that cleans up generic type names."""
+        # Route count the cached schema was generated for; routes added after build() invalidate it
+        generated_for_route_count = -1
 
         def custom_openapi() -> dict[str, Any]:
-            if app.openapi_schema:
+            nonlocal generated_for_route_count
+            if app.openapi_schema and generated_for_route_count == len(app.routes):
                 return app.openapi_schema
 
             from fastapi.openapi.utils import get_openapi
@@ -769,20 +789,19 @@ class BaseServiceBuilder:
 
                 openapi_schema["components"]["schemas"] = cleaned_schemas
 
-                # Update all $ref pointers to use cleaned names
-                def clean_refs(obj: Any) -> Any:
+                # Update all $ref pointers to use cleaned names (iterative walk, no recursion limit)
+                stack: list[Any] = [openapi_schema]
+                while stack:
+                    obj = stack.pop()
                     if isinstance(obj, dict):
                         if "$ref" in obj:
                             obj["$ref"] = re.sub(r"\[.*?\]", "", obj["$ref"])
-                        for value in obj.values():
-                            clean_refs(value)
+                        stack.extend(obj.values())
                     elif isinstance(obj, list):
-                        for item in obj:
-                            clean_refs(item)
-
-                clean_refs(openapi_schema)
+                        stack.extend(obj)
 
             app.openapi_schema = openapi_schema
+            generated_for_route_count = len(app.routes)
             return app.openapi_schema
 
         return custom_openapi
@@ -863,6 +882,8 @@ async def _register_and_start_keepalive(options: _RegistrationOptions, info: Bas
         port_env=options.port_env,
         max_retries=options.max_retries,
         retry_delay=options.retry_delay,
+        retry_backoff=options.retry_backoff,
+        max_retry_delay=options.max_retry_delay,
         fail_on_error=options.fail_on_error,
         timeout=options.timeout,
         service_key=options.service_key,
@@ -882,6 +903,8 @@ async def _register_and_start_keepalive(options: _RegistrationOptions, info: Bas
                 port_env=options.port_env,
                 max_retries=options.max_retries,
                 retry_delay=options.retry_delay,
+                retry_backoff=options.retry_backoff,
+                max_retry_delay=options.max_retry_delay,
                 fail_on_error=False,
                 timeout=options.timeout,
                 service_key=options.service_key,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -10,14 +11,18 @@ from typing import AsyncGenerator, Self
 from alembic.config import Config
 from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.pool import ConnectionPoolEntry
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
 
 from alembic import command
+from servicekit.logging import get_logger
+
+logger = get_logger(__name__)
 
 
 def _install_sqlite_connect_pragmas(engine: AsyncEngine) -> None:
@@ -77,8 +82,6 @@ class Database:
 
     async def init(self) -> None:
         """Initialize database tables using Alembic migrations or direct creation."""
-        import asyncio
-
         # Import Base here to avoid circular import at module level
         from servicekit.models import Base
 
@@ -102,6 +105,26 @@ class Database:
             loop = asyncio.get_running_loop()
             await loop.run_in_executor(None, command.upgrade, alembic_cfg, "head")
 
+    async def prewarm(self) -> None:
+        """Open pool_size connections concurrently and return them to the pool to avoid cold connects."""
+        pool = self.engine.pool
+        if not isinstance(pool, QueuePool):
+            return  # StaticPool/NullPool (e.g. in-memory SQLite) have no fixed size to fill
+        results = await asyncio.gather(*(self.engine.connect() for _ in range(pool.size())), return_exceptions=True)
+        connections = [result for result in results if isinstance(result, AsyncConnection)]
+        await asyncio.gather(*(connection.close() for connection in connections))
+
+        # Warm-up is best effort: a failed connect is logged and startup continues with a partly filled pool
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            logger.warning(
+                "database.prewarm_failed",
+                opened=len(connections),
+                failed=len(errors),
+                error=str(errors[0]),
+                error_type=type(errors[0]).__name__,
+            )
+
     @asynccontextmanager
     async def session(self) -> AsyncGenerator[AsyncSession]:
         """Create a database session context manager."""
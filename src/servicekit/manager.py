@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Iterable, Sequence
+from functools import cache
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from servicekit.repository import BaseRepository
 
@@ -13,6 +14,12 @@ if TYPE_CHECKING:
     from servicekit.schemas import CollectionStats
 
 
+@cache
+def _output_list_adapter(out_schema_cls: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Return a cached TypeAdapter that validates a list of output schemas in one call."""
+    return TypeAdapter(list[out_schema_cls])  # type: ignore[valid-type]
+
+
 class LifecycleHooks[ModelT, InSchemaT: BaseModel]:
     """Lifecycle hooks for entity operations."""
 
@@ -130,6 +137,12 @@ class BaseManager[ModelT, InSchemaT: BaseModel, OutSchemaT: BaseModel, IdT](
         """Convert ORM entity to output schema."""
         return self.out_schema_cls.model_validate(entity, from_attributes=True)
 
+    def _to_output_schemas(self, entities: Iterable[ModelT]) -> list[OutSchemaT]:
+        """Convert ORM entities to output schemas in a single list validation pass."""
+        if type(self)._to_output_schema is not BaseManager._to_output_schema:
+            return [self._to_output_schema(entity) for entity in entities]  # Honor per-entity overrides
+        return _output_list_adapter(self.out_schema_cls).validate_python(entities, from_attributes=True)
+
     async def save(self, data: InSchemaT) -> OutSchemaT:
         """Save an entity (create or update)."""
         data_dict = data.model_dump(exclude_none=True)
@@ -237,7 +250,17 @@ class BaseManager[ModelT, InSchemaT: BaseModel, OutSchemaT: BaseModel, IdT](
         for entity, changes in updates:
             await self.post_update(entity, changes)
 
-        return [self._to_output_schema(entity) for entity in outputs]
+        return self._to_output_schemas(outputs)
+
+    async def bulk_create_trusted(self, rows: Iterable[Mapping[str, Any]]) -> list[OutSchemaT]:
+        """Insert trusted, pre-validated rows as new entities without input-schema validation or lifecycle hooks."""
+        entities = [self.model_cls(**row) for row in rows]
+        if not entities:
+            return []
+        await self.repo.save_all(entities)
+        await self.repo.commit()
+        await self.repo.refresh_many(entities)
+        return self._to_output_schemas(entities)
 
     async def delete_by_id(self, id: IdT) -> None:
         """Delete an entity by its ID."""
@@ -289,19 +312,19 @@ class BaseManager[ModelT, InSchemaT: BaseModel, OutSchemaT: BaseModel, IdT](
     async def find_all(self) -> list[OutSchemaT]:
         """Find all entities."""
         entities = await self.repo.find_all()
-        return [self._to_output_schema(e) for e in entities]
+        return self._to_output_schemas(entities)
 
     async def find_paginated(self, page: int, size: int) -> tuple[list[OutSchemaT], int]:
         """Find entities with pagination."""
         offset = (page - 1) * size
         entities = await self.repo.find_all_paginated(offset, size)
         total = await self.repo.count()
-        return [self._to_output_schema(e) for e in entities], total
+        return self._to_output_schemas(entities), total
 
     async def find_all_by_id(self, ids: Sequence[IdT]) -> list[OutSchemaT]:
         """Find entities by their IDs."""
         entities = await self.repo.find_all_by_id(ids)
-        return [self._to_output_schema(e) for e in entities]
+        return self._to_output_schemas(entities)
 
     async def get_stats(self) -> CollectionStats:
         """Get collection statistics."""
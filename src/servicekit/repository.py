@@ -5,6 +5,7 @@ from typing import Iterable, Sequence
 
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
 from ulid import ULID
 
 
@@ -85,10 +86,18 @@ class Repository[T, IdT = ULID](ABC):
 class BaseRepository[T, IdT = ULID](Repository[T, IdT]):
     """Base repository implementation with common CRUD operations."""
 
-    def __init__(self, session: AsyncSession, model: type[T]) -> None:
-        """Initialize repository with database session and model type."""
+    def __init__(
+        self,
+        session: AsyncSession,
+        model: type[T],
+        *,
+        loader_options: Sequence[ORMOption] = (),
+    ) -> None:
+        """Initialize repository with database session, model type, and optional eager-loading options."""
         self.s = session
         self.model = model
+        # Applied to every find_* query, e.g. selectinload(Model.children) to batch relationship loads
+        self.loader_options = tuple(loader_options)
 
     # ---------- Create ----------
     async def save(self, entity: T) -> T:
@@ -147,12 +156,12 @@ class BaseRepository[T, IdT = ULID](Repository[T, IdT]):
 
     async def find_all(self) -> Sequence[T]:
         """Find all entities."""
-        result = await self.s.scalars(select(self.model))
+        result = await self.s.scalars(select(self.model).options(*self.loader_options))
         return result.all()
 
     async def find_all_paginated(self, offset: int, limit: int) -> Sequence[T]:
         """Find entities with pagination."""
-        result = await self.s.scalars(select(self.model).offset(offset).limit(limit))
+        result = await self.s.scalars(select(self.model).options(*self.loader_options).offset(offset).limit(limit))
         return result.all()
 
     async def find_all_by_id(self, ids: Sequence[IdT]) -> Sequence[T]:
@@ -160,12 +169,15 @@ class BaseRepository[T, IdT = ULID](Repository[T, IdT]):
         if not ids:
             return []
         id_col = getattr(self.model, "id")
-        result = await self.s.scalars(select(self.model).where(id_col.in_(ids)))
+        result = await self.s.scalars(select(self.model).options(*self.loader_options).where(id_col.in_(ids)))
         return result.all()
 
     async def find_by_id(self, id: IdT) -> T | None:
         """Find an entity by its ID."""
-        return await self.s.get(self.model, id)
+        if not self.loader_options:
+            return await self.s.get(self.model, id)
+        # populate_existing re-runs the loader options for an entity already in the identity map
+        return await self.s.get(self.model, id, options=self.loader_options, populate_existing=True)
 
     async def get_stats(self) -> dict[str, int]:
         """Get collection statistics."""
@@ -159,6 +159,39 @@ def operations_client() -> tuple[TestClient, FakeManager, CrudRouter[ItemIn, Ite
     return TestClient(app), manager, router
 
 
+def test_json_routes_declare_response_models() -> None:
+    """Every JSON-returning CRUD route declares a response model so FastAPI serializes via Pydantic to bytes."""
+    router = _build_router(FakeManager())
+
+    json_routes = [
+        route
+        for route in router.router.routes
+        if isinstance(route, APIRoute) and route.status_code != status.HTTP_204_NO_CONTENT
+    ]
+
+    assert json_routes
+    for route in json_routes:
+        assert route.response_field is not None, f"{route.path} has no response model"
+
+
+def test_schema_route_is_generated_once_at_router_creation(
+    crud_client: tuple[TestClient, FakeManager, CrudRouter[ItemIn, ItemOut]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    client, _, _ = crud_client
+    expected = ItemOut.model_json_schema()
+
+    def fail() -> dict[str, object]:
+        raise AssertionError("schema regenerated per request")
+
+    monkeypatch.setattr(ItemOut, "model_json_schema", fail)
+
+    response = client.get("/items/$schema")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == expected
+
+
 def test_create_persists_entity(crud_client: tuple[TestClient, FakeManager, CrudRouter[ItemIn, ItemOut]]) -> None:
     client, manager, _ = crud_client
 
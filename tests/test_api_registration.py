@@ -208,6 +208,153 @@ async def test_retry_logic_success_on_second_attempt():
         assert mock_client.return_value.__aenter__.return_value.post.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_retry_backoff_grows_delay_up_to_cap():
+    """Test retry_backoff multiplies the delay per attempt and max_retry_delay caps it."""
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock(
+        side_effect=httpx.HTTPStatusError("500 error", request=MagicMock(), response=MagicMock())
+    )
+
+    with (
+        patch("httpx.AsyncClient") as mock_client,
+        patch("servicekit.api.registration.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
+
+        info = ServiceInfo(id="test-service", display_name="Test Service")
+
+        await register_service(
+            orchestrator_url="http://orchestrator:9000/services/$register",
+            host="test-service",
+            port=8000,
+            info=info,
+            max_retries=5,
+            retry_delay=1.0,
+            retry_backoff=2.0,
+            max_retry_delay=5.0,
+        )
+
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [1.0, 2.0, 4.0, 5.0]
+
+
+@pytest.mark.asyncio
+async def test_retry_backoff_does_not_overflow_with_large_retry_budget():
+    """Test that a long retry budget with backoff keeps the delay capped and returns None."""
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock(
+        side_effect=httpx.HTTPStatusError("500 error", request=MagicMock(), response=MagicMock())
+    )
+
+    with (
+        patch("httpx.AsyncClient") as mock_client,
+        patch("servicekit.api.registration.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
+
+        info = ServiceInfo(id="test-service", display_name="Test Service")
+
+        result = await register_service(
+            orchestrator_url="http://orchestrator:9000/services/$register",
+            host="test-service",
+            port=8000,
+            info=info,
+            max_retries=2000,
+            retry_delay=1.0,
+            retry_backoff=2.0,
+            max_retry_delay=30.0,
+        )
+
+    assert result is None
+    assert mock_sleep.await_count == 1999
+    assert mock_sleep.await_args_list[-1].args[0] == 30.0
+
+
+@pytest.mark.asyncio
+async def test_retry_delay_above_cap_is_kept_with_default_settings():
+    """Test that a retry_delay larger than max_retry_delay is not shortened without backoff."""
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock(
+        side_effect=httpx.HTTPStatusError("500 error", request=MagicMock(), response=MagicMock())
+    )
+
+    with (
+        patch("httpx.AsyncClient") as mock_client,
+        patch("servicekit.api.registration.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+    ):
+        mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
+
+        info = ServiceInfo(id="test-service", display_name="Test Service")
+
+        await register_service(
+            orchestrator_url="http://orchestrator:9000/services/$register",
+            host="test-service",
+            port=8000,
+            info=info,
+            max_retries=3,
+            retry_delay=60.0,
+        )
+
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [60.0, 60.0]
+
+
+@pytest.mark.asyncio
+async def test_retries_reuse_one_client():
+    """Test that all registration attempts share a single HTTP client."""
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock(
+        side_effect=httpx.HTTPStatusError("500 error", request=MagicMock(), response=MagicMock())
+    )
+
+    with patch("httpx.AsyncClient") as mock_client:
+        mock_client.return_value.__aenter__.return_value.post = AsyncMock(return_value=mock_response)
+
+        info = ServiceInfo(id="test-service", display_name="Test Service")
+
+        await register_service(
+            orchestrator_url="http://orchestrator:9000/services/$register",
+            host="test-service",
+            port=8000,
+            info=info,
+            max_retries=3,
+            retry_delay=0.0,
+            timeout=5.0,
+        )
+
+        assert mock_client.return_value.__aenter__.return_value.post.call_count == 3
+        mock_client.assert_called_once_with(timeout=5.0)
+
+
+@pytest.mark.asyncio
+async def test_client_construction_error_follows_fail_on_error():
+    """Test that an error building the HTTP client is retried and handled like a failed attempt."""
+    with patch("httpx.AsyncClient", side_effect=ValueError("Unknown scheme for proxy URL")) as mock_client:
+        info = ServiceInfo(id="test-service", display_name="Test Service")
+
+        result = await register_service(
+            orchestrator_url="http://orchestrator:9000/services/$register",
+            host="test-service",
+            port=8000,
+            info=info,
+            max_retries=2,
+            retry_delay=0.0,
+            fail_on_error=False,
+        )
+
+        assert result is None
+        assert mock_client.call_count == 2
+
+        with pytest.raises(RuntimeError, match="Failed to register service"):
+            await register_service(
+                orchestrator_url="http://orchestrator:9000/services/$register",
+                host="test-service",
+                port=8000,
+                info=info,
+                max_retries=1,
+                fail_on_error=True,
+            )
+
+
 @pytest.mark.asyncio
 async def test_fail_on_error_true_raises_exception():
     """Test that fail_on_error=True raises exception after retries exhausted."""
@@ -662,6 +809,49 @@ async def test_start_keepalive():
         await stop_keepalive()
 
 
+@pytest.mark.asyncio
+async def test_keepalive_reuses_one_client_across_pings():
+    """Test that the keepalive task creates a single HTTP client for all pings."""
+    mock_response = MagicMock()
+    mock_response.raise_for_status = MagicMock()
+    mock_response.json = MagicMock(return_value={"status": "alive"})
+
+    with patch("httpx.AsyncClient") as mock_client:
+        mock_client.return_value.__aenter__.return_value.put = AsyncMock(return_value=mock_response)
+
+        await start_keepalive(
+            ping_url="http://orchestrator:9000/services/test/$ping",
+            interval=0.05,
+            timeout=5.0,
+        )
+        await asyncio.sleep(0.2)
+        await stop_keepalive()
+
+        assert mock_client.return_value.__aenter__.return_value.put.call_count >= 2
+        mock_client.assert_called_once_with(timeout=5.0)
+        mock_client.return_value.__aexit__.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_keepalive_survives_client_construction_error():
+    """Test that an error building the HTTP client is logged as a failed ping and retried."""
+    from servicekit.api import registration
+
+    with patch("httpx.AsyncClient", side_effect=ValueError("Unknown scheme for proxy URL")) as mock_client:
+        await start_keepalive(
+            ping_url="http://orchestrator:9000/services/test/$ping",
+            interval=0.05,
+            timeout=5.0,
+        )
+        await asyncio.sleep(0.2)
+
+        task = registration._keepalive_task
+        assert task is not None and not task.done()
+        assert mock_client.call_count >= 2
+
+        await stop_keepalive()
+
+
 @pytest.mark.asyncio
 async def test_stop_keepalive():
     """Test stopping keepalive background task."""
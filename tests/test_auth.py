@@ -83,6 +83,22 @@ def test_load_api_keys_from_file_with_comments():
         Path(temp_path).unlink()
 
 
+def test_load_api_keys_from_file_crlf_and_whitespace(tmp_path: Path):
+    """Test that CRLF line endings, padding, and missing trailing newline are handled."""
+    key_file = tmp_path / "keys.txt"
+    key_file.write_bytes(b"  sk_test_1  \r\n# comment\r\n\r\nsk_test_2")
+
+    assert load_api_keys_from_file(key_file) == {"sk_test_1", "sk_test_2"}
+
+
+def test_load_api_keys_from_file_empty(tmp_path: Path):
+    """Test that an empty key file yields no keys."""
+    key_file = tmp_path / "keys.txt"
+    key_file.write_text("")
+
+    assert load_api_keys_from_file(key_file) == set()
+
+
 def test_load_api_keys_from_file_not_found():
     """Test error when file doesn't exist."""
     with pytest.raises(FileNotFoundError, match="API key file not found"):
@@ -318,3 +334,27 @@ def test_service_builder_auth_logging_no_duplicates(capsys: pytest.CaptureFixtur
 
     # Should appear exactly once
     assert warning_count == 1, f"Expected 1 warning, found {warning_count}"
+
+
+def test_api_key_middleware_freezes_key_set():
+    """Test that middleware snapshots keys into a frozenset at construction."""
+    keys = {"sk_test_valid"}
+    middleware = APIKeyMiddleware(FastAPI(), api_keys=keys, unauthenticated_paths={"/health"})
+
+    keys.add("sk_test_added_later")
+
+    assert isinstance(middleware.api_keys, frozenset)
+    assert middleware.api_keys == frozenset({"sk_test_valid"})
+    assert middleware.unauthenticated_paths == frozenset({"/health"})
+
+
+def test_service_builder_with_auth_stores_frozen_keys() -> None:
+    """Test that with_auth freezes list input into an immutable key set."""
+    from servicekit.api import BaseServiceBuilder, ServiceInfo
+
+    info = ServiceInfo(id="test-service", display_name="Test Service")
+    builder = BaseServiceBuilder(info=info).with_auth(api_keys=["sk_dev_a", "sk_dev_b", "sk_dev_a"])
+
+    assert builder._auth_options is not None
+    assert builder._auth_options.api_keys == frozenset({"sk_dev_a", "sk_dev_b"})
+    assert isinstance(builder._auth_options.unauthenticated_paths, frozenset)
@@ -1,11 +1,12 @@
 import tempfile
 from pathlib import Path
 from types import SimpleNamespace
-from typing import cast
+from typing import Any, cast
 
 import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import QueuePool
 
 import servicekit.database as database_module
 from servicekit import SqliteDatabase, SqliteDatabaseBuilder
@@ -253,6 +254,51 @@ class TestSqliteDatabase:
         assert db_file.is_in_memory() is False
         await db_file.dispose()
 
+    async def test_prewarm_fills_connection_pool(self, tmp_path: Path) -> None:
+        """Test prewarm() opens pool_size connections and returns them to the pool."""
+        db = SqliteDatabase(f"sqlite+aiosqlite:///{tmp_path / 'prewarm.db'}", pool_size=3)
+        pool = cast(QueuePool, db.engine.pool)
+        assert pool.checkedin() == 0
+
+        await db.prewarm()
+
+        assert pool.checkedin() == 3
+        assert pool.checkedout() == 0
+        await db.dispose()
+
+    async def test_prewarm_survives_failed_connect(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test prewarm() returns opened connections to the pool and does not raise when one connect fails."""
+        db = SqliteDatabase(f"sqlite+aiosqlite:///{tmp_path / 'prewarm.db'}", pool_size=3)
+        pool = cast(QueuePool, db.engine.pool)
+        original_connect = AsyncEngine.connect
+        calls = 0
+
+        def flaky_connect(engine: AsyncEngine) -> Any:
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+
+                async def refuse() -> None:
+                    raise ConnectionError("too many connections")
+
+                return refuse()
+            return original_connect(engine)
+
+        monkeypatch.setattr(AsyncEngine, "connect", flaky_connect)
+
+        await db.prewarm()
+
+        assert pool.checkedin() == 2
+        assert pool.checkedout() == 0
+        monkeypatch.undo()
+        await db.dispose()
+
+    async def test_prewarm_is_noop_for_in_memory(self) -> None:
+        """Test prewarm() skips pools that are not QueuePools (in-memory SQLite)."""
+        db = SqliteDatabase("sqlite+aiosqlite:///:memory:")
+        await db.prewarm()
+        await db.dispose()
+
 
 class TestSqliteDatabaseBuilder:
     """Tests for SqliteDatabaseBuilder class."""
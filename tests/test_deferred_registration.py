@@ -29,6 +29,8 @@ def _make_options() -> _RegistrationOptions:
         port_env="SERVICEKIT_PORT",
         max_retries=1,
         retry_delay=0.0,
+        retry_backoff=1.0,
+        max_retry_delay=30.0,
         fail_on_error=False,
         timeout=2.0,
         enable_keepalive=False,
@@ -231,6 +233,8 @@ def test_resolve_port_from_env(monkeypatch: pytest.MonkeyPatch):
         port_env="SERVICEKIT_PORT",
         max_retries=1,
         retry_delay=0.0,
+        retry_backoff=1.0,
+        max_retry_delay=30.0,
         fail_on_error=False,
         timeout=2.0,
         enable_keepalive=False,
@@ -255,6 +259,8 @@ def test_resolve_port_default(monkeypatch: pytest.MonkeyPatch):
         port_env="SERVICEKIT_PORT",
         max_retries=1,
         retry_delay=0.0,
+        retry_backoff=1.0,
+        max_retry_delay=30.0,
         fail_on_error=False,
         timeout=2.0,
         enable_keepalive=False,
@@ -279,6 +285,8 @@ def test_resolve_port_invalid_env(monkeypatch: pytest.MonkeyPatch):
         port_env="SERVICEKIT_PORT",
         max_retries=1,
         retry_delay=0.0,
+        retry_backoff=1.0,
+        max_retry_delay=30.0,
         fail_on_error=False,
         timeout=2.0,
         enable_keepalive=False,
@@ -332,6 +340,8 @@ async def test_register_and_start_keepalive_with_keepalive():
         port_env="SERVICEKIT_PORT",
         max_retries=1,
         retry_delay=0.0,
+        retry_backoff=1.0,
+        max_retry_delay=30.0,
         fail_on_error=False,
         timeout=2.0,
         enable_keepalive=True,
@@ -1,11 +1,15 @@
 """Tests for API dependency injection."""
 
+from typing import Annotated
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from fastapi import BackgroundTasks, Depends, FastAPI
+from fastapi.testclient import TestClient
 from pytest import MonkeyPatch
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from servicekit import Database
+from servicekit import Database, SqliteDatabaseBuilder
 from servicekit.api.app import AppManager
 from servicekit.api.dependencies import (
     get_app_manager,
@@ -93,3 +97,27 @@ async def test_get_session_yields_session():
 
     # Verify session was properly opened
     mock_database.session.assert_called_once()
+
+
+def test_background_task_get_session_opens_its_own_session():
+    """Test that a background task calling get_session does not reuse the request session."""
+    database = SqliteDatabaseBuilder.in_memory().build()
+    set_database(database)
+    app = FastAPI()
+    seen: dict[str, AsyncSession] = {}
+
+    async def record_background_session() -> None:
+        async for session in get_session(get_database()):
+            seen["background"] = session
+
+    @app.get("/work")
+    async def work(
+        session: Annotated[AsyncSession, Depends(get_session)],
+        background_tasks: BackgroundTasks,
+    ) -> dict[str, str]:
+        seen["request"] = session
+        background_tasks.add_task(record_background_session)
+        return {"status": "ok"}
+
+    assert TestClient(app).get("/work").status_code == 200
+    assert seen["background"] is not seen["request"]
@@ -393,6 +393,22 @@ class TestJobRouter:
         assert "required" in job_record_schema
         assert "id" in job_record_schema["required"]
 
+    @pytest.mark.asyncio
+    async def test_jobs_schema_is_generated_once_at_router_creation(
+        self, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test GET /api/v1/jobs/$schema serves the schema built when the router was created."""
+        expected = (await client.get("/api/v1/jobs/$schema")).json()
+
+        def fail(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("schema regenerated per request")
+
+        monkeypatch.setattr("servicekit.api.routers.job.TypeAdapter", fail)
+
+        response = await client.get("/api/v1/jobs/$schema")
+        assert response.status_code == 200
+        assert response.json() == expected
+
 
 class TestJobRouterIntegration:
     """Integration tests for job router with BaseServiceBuilder."""
@@ -1,8 +1,10 @@
+from typing import Any
+
 from ulid import ULID
 
 from servicekit import SqliteDatabaseBuilder
 
-from .conftest import DemoData, TestEntityIn, TestEntityManager, TestEntityOut, TestEntityRepository
+from .conftest import DemoData, TestEntity, TestEntityIn, TestEntityManager, TestEntityOut, TestEntityRepository
 
 
 class TestBaseManager:
@@ -105,6 +107,33 @@ class TestBaseManager:
 
         await db.dispose()
 
+    async def test_bulk_create_trusted(self) -> None:
+        """Test inserting plain dict rows without input-schema validation."""
+        db = SqliteDatabaseBuilder.in_memory().build()
+        await db.init()
+
+        async with db.session() as session:
+            repo = TestEntityRepository(session)
+            manager = TestEntityManager(repo)
+            explicit_id = ULID()
+
+            rows: list[dict[str, Any]] = [
+                {"id": explicit_id, "name": "seed0", "data": {"x": 0, "y": 0, "z": 0, "tags": []}},
+                {"name": "seed1", "data": {"x": 1, "y": 2, "z": 3, "tags": ["a"]}},
+            ]
+            results = await manager.bulk_create_trusted(rows)
+
+            assert [r.name for r in results] == ["seed0", "seed1"]
+            assert all(isinstance(r, TestEntityOut) for r in results)
+            assert results[0].id == explicit_id
+            assert results[1].id is not None
+            assert results[1].data == DemoData(x=1, y=2, z=3, tags=["a"])
+            assert results[1].created_at is not None
+            assert await manager.count() == 2
+            assert await manager.bulk_create_trusted([]) == []
+
+        await db.dispose()
+
     async def test_delete_by_id(self) -> None:
         """Test deleting an entity by ID."""
         db = SqliteDatabaseBuilder.in_memory().build()
@@ -377,6 +406,45 @@ class TestBaseManager:
 
         await db.dispose()
 
+    async def test_list_outputs_match_per_entity_conversion(self) -> None:
+        """Test that list results are validated in one pass yet equal per-entity conversion."""
+        db = SqliteDatabaseBuilder.in_memory().build()
+        await db.init()
+
+        async with db.session() as session:
+            repo = TestEntityRepository(session)
+            manager = TestEntityManager(repo)
+            await manager.save_all(
+                [TestEntityIn(name=f"config{i}", data=DemoData(x=i, y=i, z=i, tags=[])) for i in range(3)]
+            )
+
+            entities = await repo.find_all()
+            results = await manager.find_all()
+
+            assert results == [manager._to_output_schema(entity) for entity in entities]
+            assert all(isinstance(r.data, DemoData) for r in results)
+
+        await db.dispose()
+
+    async def test_list_outputs_honor_to_output_schema_override(self) -> None:
+        """Test that subclasses overriding _to_output_schema still control list conversion."""
+
+        class RenamingManager(TestEntityManager):
+            def _to_output_schema(self, entity: TestEntity) -> TestEntityOut:
+                output = super()._to_output_schema(entity)
+                return output.model_copy(update={"name": output.name.upper()})
+
+        db = SqliteDatabaseBuilder.in_memory().build()
+        await db.init()
+
+        async with db.session() as session:
+            manager = RenamingManager(TestEntityRepository(session))
+            await manager.save_all([TestEntityIn(name="config", data=DemoData(x=1, y=1, z=1, tags=[]))])
+
+            assert [r.name for r in await manager.find_all()] == ["CONFIG"]
+
+        await db.dispose()
+
     async def test_find_all_by_id(self) -> None:
         """Test finding multiple entities by IDs through manager."""
         db = SqliteDatabaseBuilder.in_memory().build()
@@ -1,6 +1,11 @@
+import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column, relationship, selectinload
 from ulid import ULID
 
-from servicekit import BaseRepository, SqliteDatabaseBuilder
+from servicekit import BaseRepository, Entity, SqliteDatabaseBuilder, ULIDType
 
 from .conftest import DemoData, TestEntity
 
@@ -333,3 +338,65 @@ class TestBaseRepository:
                 assert await repo3.count() == 1
 
         await db.dispose()
+
+
+class TreeNode(Entity):
+    """Self-referencing entity used to exercise relationship loader options."""
+
+    __tablename__ = "test_tree_nodes"
+
+    name: Mapped[str] = mapped_column(nullable=False)
+    parent_id: Mapped[ULID | None] = mapped_column(ULIDType, ForeignKey("test_tree_nodes.id"), default=None)
+    children: Mapped[list["TreeNode"]] = relationship(lazy="raise")
+
+
+class TestRepositoryLoaderOptions:
+    """Tests for eager-loading options on BaseRepository."""
+
+    async def _seed_tree(self, session: AsyncSession) -> TreeNode:
+        root = TreeNode(name="root")
+        session.add(root)
+        await session.flush()
+        session.add_all([TreeNode(name="a", parent_id=root.id), TreeNode(name="b", parent_id=root.id)])
+        await session.commit()
+        return root
+
+    async def test_find_methods_apply_loader_options(self) -> None:
+        """Relationships configured via loader_options are loaded eagerly by every find method."""
+        db = SqliteDatabaseBuilder.in_memory().build()
+        await db.init()
+
+        async with db.session() as session:
+            root = await self._seed_tree(session)
+            repo = BaseRepository[TreeNode, ULID](session, TreeNode, loader_options=[selectinload(TreeNode.children)])
+
+            found = await repo.find_by_id(root.id)
+            assert found is not None
+            assert sorted(child.name for child in found.children) == ["a", "b"]
+
+            all_nodes = await repo.find_all()
+            assert {node.name: len(node.children) for node in all_nodes} == {"root": 2, "a": 0, "b": 0}
+
+            paginated = await repo.find_all_paginated(0, 10)
+            assert sum(len(node.children) for node in paginated) == 2
+
+            by_id = await repo.find_all_by_id([root.id])
+            assert len(by_id[0].children) == 2
+
+        await db.dispose()
+
+    async def test_find_without_loader_options_keeps_relationships_lazy(self) -> None:
+        """Without loader options relationships are not loaded."""
+        db = SqliteDatabaseBuilder.in_memory().build()
+        await db.init()
+
+        async with db.session() as session:
+            root = await self._seed_tree(session)
+            repo = BaseRepository[TreeNode, ULID](session, TreeNode)
+
+            found = await repo.find_by_id(root.id)
+            assert found is not None
+            with pytest.raises(InvalidRequestError):
+                _ = found.children
+
+        await db.dispose()
@@ -0,0 +1,131 @@
+"""Tests for BaseServiceBuilder application assembly."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, cast
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy.pool import QueuePool
+
+from servicekit import SqliteDatabase
+from servicekit.api import BaseServiceBuilder, Router, ServiceInfo
+from servicekit.schemas import PaginatedResponse
+
+
+class WidgetOut(BaseModel):
+    """Output schema used to produce a generic OpenAPI component."""
+
+    name: str
+
+
+class WidgetRouter(Router):
+    """Router exposing a generic paginated response model."""
+
+    def _register_routes(self) -> None:
+        @self.router.get("", response_model=PaginatedResponse[WidgetOut])
+        async def list_widgets() -> PaginatedResponse[WidgetOut]:
+            return PaginatedResponse(items=[WidgetOut(name="a")], total=1, page=1, size=10)
+
+
+def _collect_refs(obj: Any) -> list[str]:
+    """Collect every $ref value in a nested OpenAPI document."""
+    refs: list[str] = []
+    if isinstance(obj, dict):
+        if "$ref" in obj:
+            refs.append(obj["$ref"])
+        for value in obj.values():
+            refs.extend(_collect_refs(value))
+    elif isinstance(obj, list):
+        for item in obj:
+            refs.extend(_collect_refs(item))
+    return refs
+
+
+def test_openapi_cleans_generic_schema_names_and_refs() -> None:
+    """Generic type parameters are stripped from component names and all $ref pointers."""
+    app = (
+        BaseServiceBuilder(info=ServiceInfo(id="widgets", display_name="Widgets"))
+        .include_router(WidgetRouter.create(prefix="/api/v1/widgets", tags=["widgets"]))
+        .build()
+    )
+
+    schema = TestClient(app).get("/openapi.json").json()
+
+    components = schema["components"]["schemas"]
+    assert all("[" not in name for name in components)
+    assert all("[" not in component.get("title", "") for component in components.values())
+    assert any(component.get("title") == "PaginatedResponse" for component in components.values())
+
+    refs = _collect_refs(schema)
+    assert refs
+    for ref in refs:
+        assert "[" not in ref
+        assert ref.removeprefix("#/components/schemas/") in components
+
+
+def test_with_database_prewarm_pool_fills_pool_on_startup(tmp_path: Path) -> None:
+    """prewarm_pool=True opens pool_size connections during lifespan startup."""
+    app = (
+        BaseServiceBuilder(info=ServiceInfo(id="prewarm", display_name="Prewarm"))
+        .with_database(f"sqlite+aiosqlite:///{tmp_path / 'prewarm.db'}", pool_size=2, prewarm_pool=True)
+        .build()
+    )
+
+    with TestClient(app):
+        pool = cast(QueuePool, app.state.database.engine.pool)
+        assert pool.checkedin() == 2
+
+
+def test_with_database_does_not_prewarm_by_default(tmp_path: Path) -> None:
+    """Without prewarm_pool only the connections used by init() are pooled."""
+    app = (
+        BaseServiceBuilder(info=ServiceInfo(id="prewarm", display_name="Prewarm"))
+        .with_database(f"sqlite+aiosqlite:///{tmp_path / 'cold.db'}", pool_size=4)
+        .build()
+    )
+
+    with TestClient(app):
+        pool = cast(QueuePool, app.state.database.engine.pool)
+        assert pool.checkedin() < 4
+
+
+def test_openapi_schema_is_generated_at_build() -> None:
+    """build() caches the OpenAPI schema so /openapi.json serves the precomputed dict."""
+    app = (
+        BaseServiceBuilder(info=ServiceInfo(id="widgets", display_name="Widgets"))
+        .include_router(WidgetRouter.create(prefix="/api/v1/widgets", tags=["widgets"]))
+        .build()
+    )
+
+    cached = app.openapi_schema
+    assert cached is not None
+    assert app.openapi() is cached
+    assert TestClient(app).get("/openapi.json").json()["paths"].keys() == cached["paths"].keys()
+
+
+def test_openapi_schema_regenerates_for_routes_added_after_build() -> None:
+    """Routes added to the app after build() invalidate the cached OpenAPI schema."""
+    app = BaseServiceBuilder(info=ServiceInfo(id="widgets", display_name="Widgets")).build()
+    assert "/late" not in app.openapi()["paths"]
+
+    @app.get("/late")
+    async def late() -> dict[str, str]:
+        return {"status": "ok"}
+
+    assert "/late" in TestClient(app).get("/openapi.json").json()["paths"]
+
+
+def test_with_database_instance_is_shared_across_apps_and_not_disposed(tmp_path: Path) -> None:
+    """Apps built with the same Database instance share one engine and leave its lifecycle to the caller."""
+    database = SqliteDatabase(f"sqlite+aiosqlite:///{tmp_path / 'shared.db'}")
+    first = BaseServiceBuilder(info=ServiceInfo(id="first", display_name="First")).with_database(database).build()
+    second = BaseServiceBuilder(info=ServiceInfo(id="second", display_name="Second")).with_database(database).build()
+
+    with TestClient(first):
+        with TestClient(second):
+            assert first.state.database.engine is second.state.database.engine
+        # Shutting down the second app must not dispose the engine the first app still uses
+        pool = cast(QueuePool, first.state.database.engine.pool)
+        assert pool.checkedin() >= 1
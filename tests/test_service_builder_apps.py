@@ -425,6 +425,21 @@ def test_system_apps_schema_endpoint():
         assert "prefix" in app_info_schema["required"]
 
 
+def test_system_apps_schema_is_generated_once_at_router_creation(monkeypatch: pytest.MonkeyPatch):
+    """Test /api/v1/system/apps/$schema serves the schema built when the router was created."""
+    app = BaseServiceBuilder(info=ServiceInfo(id="test-service", display_name="Test Service")).with_system().build()
+
+    def fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("schema regenerated per request")
+
+    monkeypatch.setattr("servicekit.api.routers.system.TypeAdapter", fail)
+
+    with TestClient(app) as client:
+        response = client.get("/api/v1/system/apps/$schema")
+        assert response.status_code == 200
+        assert response.json()["items"]["$ref"] == "#/$defs/AppInfo"
+
+
 def test_service_builder_with_apps_package_discovery(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Test auto-discovering apps from package resources."""
 